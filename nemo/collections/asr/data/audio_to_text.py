@@ -51,26 +51,22 @@ def _speech_collate_fn(batch, pad_id):
         max_audio_len = max(audio_lengths).item()
     max_tokens_len = max(tokens_lengths).item()
 
-    audio_signal, tokens = [], []
-    for sig, sig_len, tokens_i, tokens_i_len in batch:
+    # Allocate the padded batch buffers once and copy every sample into its row,
+    # rather than padding each sample into a new tensor and stacking the results
+    batch_size = len(batch)
+    audio_signal = batch[0][0].new_zeros((batch_size, max_audio_len)) if has_audio else None
+    tokens = batch[0][2].new_full((batch_size, max_tokens_len), pad_id)
+    for idx, (sig, sig_len, tokens_i, tokens_i_len) in enumerate(batch):
         if has_audio:
             sig_len = sig_len.item()
-            if sig_len < max_audio_len:
-                pad = (0, max_audio_len - sig_len)
-                sig = torch.nn.functional.pad(sig, pad)
-            audio_signal.append(sig)
+            audio_signal[idx, :sig_len].copy_(sig[:sig_len])
         tokens_i_len = tokens_i_len.item()
-        if tokens_i_len < max_tokens_len:
-            pad = (0, max_tokens_len - tokens_i_len)
-            tokens_i = torch.nn.functional.pad(tokens_i, pad, value=pad_id)
-        tokens.append(tokens_i)
+        tokens[idx, :tokens_i_len].copy_(tokens_i[:tokens_i_len])
 
     if has_audio:
-        audio_signal = torch.stack(audio_signal)
         audio_lengths = torch.stack(audio_lengths)
     else:
-        audio_signal, audio_lengths = None, None
-    tokens = torch.stack(tokens)
+        audio_lengths = None
     tokens_lengths = torch.stack(tokens_lengths)
 
     return audio_signal, audio_lengths, tokens, tokens_lengths
@@ -392,12 +388,13 @@ class AudioToCharWithDursDataset(AudioToCharDataset):
         dim = dim if dim != -1 else len(tensors[0].shape) - 1
         dtype = tensors[0].dtype if dtype is None else dtype
         max_len = max(tensor.shape[dim] for tensor in tensors)
-        new_tensors = []
-        for tensor in tensors:
-            pad = (2 * len(tensor.shape)) * [0]
-            pad[-2 * dim - 1] = max_len - tensor.shape[dim]
-            new_tensors.append(F.pad(tensor, pad=pad, value=value))
-        return torch.stack(new_tensors).to(dtype=dtype)
+        # Allocate the padded batch once and copy every tensor into its slot
+        shape = list(tensors[0].shape)
+        shape[dim] = max_len
+        merged = tensors[0].new_full([len(tensors)] + shape, value, dtype=dtype)
+        for idx, tensor in enumerate(tensors):
+            merged[idx].narrow(dim, 0, tensor.shape[dim]).copy_(tensor)
+        return merged
 
     @staticmethod
     def _interleave(x, y):
@@ -15,6 +15,7 @@
 from typing import List
 
 import editdistance
+import numpy as np
 import torch
 from pytorch_lightning.metrics import Metric
 
@@ -22,6 +23,13 @@ from nemo.collections.asr.parts.rnnt_utils import Hypothesis
 from nemo.collections.common.tokenizers.tokenizer_spec import TokenizerSpec
 from nemo.utils import logging
 
+try:
+    from nemo.collections.asr.parts import numba_utils
+
+    HAVE_NUMBA = True
+except (ImportError, ModuleNotFoundError):
+    HAVE_NUMBA = False
+
 
 class WERBPE(Metric):
     """
@@ -87,11 +95,16 @@ class WERBPE(Metric):
         Args:
             predictions: A torch.Tensor of shape [Batch, Time] of integer indices that correspond
                 to the index of some character in the vocabulary of the tokenizer.
+                Alternatively, a torch.Tensor of shape [Batch, Time, Vocabulary + 1] of log-probabilities
+                emitted by the CTC decoder, in which case the greedy labels are computed on the device
+                of `predictions` and the Hypothesis `score` (if requested) is the sum of the log-probabilities
+                of its non-blank frames.
             predictions_len: Optional tensor of length `Batch` which contains the integer lengths
                 of the sequence in the padded `predictions` tensor.
             return_hypotheses: Bool flag whether to return just the decoding predictions of the model
                 or a Hypothesis object that holds information such as the decoded `text`,
-                the `alignment` of emited by the CTC Model, and the `length` of the sequence (if available).
+                the `alignment` of emited by the CTC Model, the `timestep` at which each decoded token was
+                emitted, and the `length` of the sequence (if available).
                 May also contain the log-probabilities of the decoder (if this method is called via
                 transcribe()) inside `y_sequence`, otherwise it is set None as it is a duplicate of
                 `alignments`.
@@ -101,20 +114,47 @@ class WERBPE(Metric):
             or a list of Hypothesis objects containing additional information.
         """
         hypotheses = []
+        predictions_logprobs = None
+        if predictions.dim() == 3:
+            # Reduce over the vocabulary on the original device, so that only the [B, T] labels
+            # (and their log-probabilities, if required) are copied to the host.
+            predictions_logprobs, predictions = predictions.max(dim=-1)
+
         # Drop predictions to CPU
-        prediction_cpu_tensor = predictions.long().cpu()
+        labels_cpu = predictions.long().cpu().numpy()
+        batch_size, max_time = labels_cpu.shape[0], labels_cpu.shape[1]
+        if predictions_len is not None:
+            lengths_list = predictions_len.cpu().tolist()
+        else:
+            lengths_list = [max_time] * batch_size
+
+        # CTC decoding procedure, applied to the whole batch in a single pass over the host arrays
+        # A frame is valid if it lies within the length of its sample
+        valid = np.arange(max_time)[None, :] < np.asarray(lengths_list)[:, None]
+        non_blank = (labels_cpu != self.blank_id) & valid
+        if not HAVE_NUMBA:
+            # A label is emitted if it is not blank and differs from the label of the previous frame
+            emitted_cpu = non_blank.copy()
+            emitted_cpu[:, 1:] &= labels_cpu[:, 1:] != labels_cpu[:, :-1]
+
+        scores = None
+        if return_hypotheses and predictions_logprobs is not None:
+            logprobs_cpu = predictions_logprobs.detach().float().cpu().numpy()
+            # Row-wise dot product of the log-probs with the non-blank mask, returned as python floats
+            scores = np.einsum('bt,bt->b', logprobs_cpu, non_blank.astype(logprobs_cpu.dtype)).tolist()
+
         # iterate over batch
-        for ind in range(prediction_cpu_tensor.shape[self.batch_dim_index]):
-            prediction = prediction_cpu_tensor[ind].detach().numpy().tolist()
-            if predictions_len is not None:
-                prediction = prediction[: predictions_len[ind]]
-            # CTC decoding procedure
-            decoded_prediction = []
-            previous = self.blank_id
-            for p in prediction:
-                if (p != previous or previous == self.blank_id) and p != self.blank_id:
-                    decoded_prediction.append(p)
-                previous = p
+        for ind in range(batch_size):
+            if HAVE_NUMBA:
+                # Collapse the labels of this sample in a single compiled pass
+                tokens, timestep = numba_utils.ctc_greedy_decode_labels(
+                    labels_cpu[ind, : lengths_list[ind]], self.blank_id
+                )
+            else:
+                # Frames at which a label was emitted, computed directly on the host mask
+                timestep = np.flatnonzero(emitted_cpu[ind])
+                tokens = labels_cpu[ind][timestep]
+            decoded_prediction = tokens.tolist()
 
             text = self.decode_tokens_to_str(decoded_prediction)
 
@@ -123,10 +163,11 @@ class WERBPE(Metric):
             else:
                 hypothesis = Hypothesis(
                     y_sequence=None,  # logprob info added by transcribe method
-                    score=-1.0,
+                    score=scores[ind] if scores is not None else -1.0,
                     text=text,
-                    alignments=prediction,
-                    length=predictions_len[ind] if predictions_len is not None else 0,
+                    timestep=timestep.tolist(),
+                    alignments=labels_cpu[ind][: lengths_list[ind]].tolist(),
+                    length=lengths_list[ind] if predictions_len is not None else 0,
                 )
             hypotheses.append(hypothesis)
         return hypotheses
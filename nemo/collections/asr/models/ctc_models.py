@@ -192,8 +192,11 @@ class EncDecCTCModel(ASRModel, ExportableEncDecModel):
                         for idx in range(logits.shape[0]):
                             hypotheses.append(logits[idx][: logits_len[idx]])
                     else:
+                        # Hypotheses are decoded from the log-probabilities so that they carry a score
                         current_hypotheses = self._wer.ctc_decoder_predictions_tensor(
-                            greedy_predictions, predictions_len=logits_len, return_hypotheses=return_hypotheses,
+                            logits if return_hypotheses else greedy_predictions,
+                            predictions_len=logits_len,
+                            return_hypotheses=return_hypotheses,
                         )
 
                         if return_hypotheses:
@@ -86,3 +86,30 @@ def _phase_vocoder_kernel(D, time_steps, phi_advance, d_stretch, phase_acc, scal
         phase_acc += phi_advance + dphase
 
     return d_stretch
+
+
+@jit(nopython=True, nogil=True, cache=True)
+def ctc_greedy_decode_labels(labels: np.ndarray, blank_id: int):
+    """
+    Numba optimized kernel to collapse a sequence of greedy CTC labels.
+    Removes consecutive repeated labels as well as all blank labels, in a single pass over the sequence.
+    Args:
+        labels: Int64 ndarray of greedy labels of shape [t], already truncated to the sequence length.
+        blank_id: Index of the CTC blank token.
+    Returns:
+        A tuple of two int64 ndarrays, holding the decoded labels and the timesteps at which they were emitted.
+    """
+    tokens = np.empty(labels.shape[0], dtype=np.int64)
+    timesteps = np.empty(labels.shape[0], dtype=np.int64)
+    num_tokens = 0
+    previous = blank_id
+
+    for t in range(labels.shape[0]):
+        label = labels[t]
+        if label != blank_id and label != previous:
+            tokens[num_tokens] = label
+            timesteps[num_tokens] = t
+            num_tokens += 1
+        previous = label
+
+    return tokens[:num_tokens], timesteps[:num_tokens]
@@ -44,7 +44,8 @@ def pack_hypotheses(
     logitlen: torch.Tensor,
     alignments: Optional[List[List[int]]] = None,
 ) -> List[rnnt_utils.Hypothesis]:
-    logitlen_cpu = logitlen.to("cpu")
+    # Convert lengths to python ints once, rather than indexing a tensor per hypothesis
+    logitlen_cpu = logitlen.to("cpu").tolist()
     return [
         rnnt_utils.Hypothesis(
             y_sequence=torch.tensor(sent, dtype=torch.long),
@@ -241,11 +242,13 @@ class GreedyRNNTInfer(_GreedyRNNTInfer):
             hypotheses = []
             timesteps = []
             alignments = [] if self.preserve_alignments else None
+            # Move all lengths to the host once, instead of indexing (and syncing on) the tensor per sample
+            encoded_lengths_list = encoded_lengths.tolist()
             # Process each sequence independently
             with self.decoder.as_frozen(), self.joint.as_frozen():
                 for batch_idx in range(encoder_output.size(0)):
                     inseq = encoder_output[batch_idx, :, :].unsqueeze(1)  # [T, 1, D]
-                    logitlen = encoded_lengths[batch_idx]
+                    logitlen = encoded_lengths_list[batch_idx]
                     sentence, timestep, alignment = self._greedy_decode(inseq, logitlen)
                     hypotheses.append(sentence)
                     timesteps.append(timestep)
@@ -262,9 +265,9 @@ class GreedyRNNTInfer(_GreedyRNNTInfer):
         return (packed_result,)
 
     @torch.no_grad()
-    def _greedy_decode(self, x: torch.Tensor, out_len: torch.Tensor):
+    def _greedy_decode(self, x: torch.Tensor, out_len: int):
         # x: [T, 1, D]
-        # out_len: [seq_len]
+        # out_len: seq_len
 
         # Initialize blank state and empty label set
         hidden = None
@@ -450,8 +453,9 @@ class GreedyBatchedRNNTInfer(_GreedyRNNTInfer):
             # Mask buffers
             blank_mask = torch.full([batchsize], fill_value=0, dtype=torch.bool, device=device)
 
-            # Get max sequence length
-            max_out_len = out_len.max()
+            # Get max sequence length, keeping the lengths on the host for per-sample checks
+            out_len_list = out_len.tolist()
+            max_out_len = max(out_len_list)
             for time_idx in range(max_out_len):
                 f = x.narrow(dim=1, start=time_idx, length=1)  # [B, 1, D]
 
@@ -499,9 +503,12 @@ class GreedyBatchedRNNTInfer(_GreedyRNNTInfer):
                     # before adding alignment
                     if self.preserve_alignments:
                         # Insert ids into last timestep per sample
-                        logp_vals = logp.to('cpu').max(1)[1]
+                        # `k` already holds the argmax of `logp`, so only the [B] labels need to be copied.
+                        # An explicit copy is required, as `k` is later updated in-place and `.to('cpu')`
+                        # would alias it when decoding already runs on the CPU.
+                        logp_vals = k.to('cpu', copy=True)
                         for batch_idx in range(batchsize):
-                            if time_idx < out_len[batch_idx]:
+                            if time_idx < out_len_list[batch_idx]:
                                 alignments[batch_idx][-1].append(logp_vals[batch_idx])
                         del logp_vals
                     del logp
@@ -596,8 +603,9 @@ class GreedyBatchedRNNTInfer(_GreedyRNNTInfer):
         # Mask buffers
         blank_mask = torch.full([batchsize], fill_value=0, dtype=torch.bool, device=device)
 
-        # Get max sequence length
-        max_out_len = out_len.max()
+        # Get max sequence length, keeping the lengths on the host for per-sample checks
+        out_len_list = out_len.tolist()
+        max_out_len = max(out_len_list)
         for time_idx in range(max_out_len):
             f = x.narrow(dim=1, start=time_idx, length=1)  # [B, 1, D]
 
@@ -652,9 +660,12 @@ class GreedyBatchedRNNTInfer(_GreedyRNNTInfer):
                 # before adding alignment
                 if self.preserve_alignments:
                     # Insert ids into last timestep per sample
-                    logp_vals = logp.to('cpu').max(1)[1]
+                    # `k` already holds the argmax of `logp`, so only the [B] labels need to be copied.
+                    # An explicit copy is required, as `k` is later updated in-place and `.to('cpu')`
+                    # would alias it when decoding already runs on the CPU.
+                    logp_vals = k.to('cpu', copy=True)
                     for batch_idx in range(batchsize):
-                        if time_idx < out_len[batch_idx]:
+                        if time_idx < out_len_list[batch_idx]:
                             alignments[batch_idx][-1].append(logp_vals[batch_idx])
                     del logp_vals
                 del logp
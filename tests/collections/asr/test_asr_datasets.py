@@ -17,7 +17,12 @@ import os
 import pytest
 import torch
 
-from nemo.collections.asr.data.audio_to_text import TarredAudioToBPEDataset, TarredAudioToCharDataset
+from nemo.collections.asr.data.audio_to_text import (
+    AudioToCharWithDursDataset,
+    TarredAudioToBPEDataset,
+    TarredAudioToCharDataset,
+    _speech_collate_fn,
+)
 from nemo.collections.asr.parts.features import WaveformFeaturizer
 from nemo.collections.common import tokenizers
 
@@ -106,3 +111,31 @@ class TestASRDatasets:
         for _ in ds_list_load:
             count += 1
         assert count == 32
+
+    @pytest.mark.unit
+    def test_speech_collate_fn(self):
+        batch = [
+            (torch.ones(3), torch.tensor(3), torch.tensor([1, 2]), torch.tensor(2)),
+            (torch.ones(5), torch.tensor(5), torch.tensor([3, 4, 5]), torch.tensor(3)),
+        ]
+        audio_signal, audio_lengths, tokens, tokens_lengths = _speech_collate_fn(batch, pad_id=-1)
+
+        assert torch.equal(audio_signal, torch.tensor([[1.0, 1.0, 1.0, 0.0, 0.0], [1.0, 1.0, 1.0, 1.0, 1.0]]))
+        assert torch.equal(audio_lengths, torch.tensor([3, 5]))
+        assert torch.equal(tokens, torch.tensor([[1, 2, -1], [3, 4, 5]]))
+        assert torch.equal(tokens_lengths, torch.tensor([2, 3]))
+
+        # text-only batches carry no audio
+        batch = [(None, None, tokens_i, tokens_len) for _, _, tokens_i, tokens_len in batch]
+        audio_signal, audio_lengths, tokens, _ = _speech_collate_fn(batch, pad_id=0)
+        assert audio_signal is None and audio_lengths is None
+        assert torch.equal(tokens, torch.tensor([[1, 2, 0], [3, 4, 5]]))
+
+    @pytest.mark.unit
+    def test_durs_dataset_merge(self):
+        merged = AudioToCharWithDursDataset._merge([[1, 2], torch.tensor([3, 4, 5]), [6]], value=-1, dtype=torch.long)
+        assert torch.equal(merged, torch.tensor([[1, 2, -1], [3, 4, 5], [6, -1, -1]]))
+
+        tensors = [torch.ones(2, 3), torch.ones(2, 1)]
+        merged = AudioToCharWithDursDataset._merge(tensors, dim=-1)
+        assert torch.equal(merged, torch.tensor([[[1.0, 1.0, 1.0]] * 2, [[1.0, 0.0, 0.0]] * 2]))
@@ -19,10 +19,18 @@ import string
 import pytest
 import torch
 
+from nemo.collections.asr.metrics import wer as wer_module
 from nemo.collections.asr.metrics.wer import WER, word_error_rate
 from nemo.collections.asr.parts.rnnt_utils import Hypothesis
 from nemo.utils import logging
 
+try:
+    from nemo.collections.asr.parts import numba_utils
+
+    HAVE_NUMBA = True
+except (ImportError, ModuleNotFoundError):
+    HAVE_NUMBA = False
+
 
 class TestWordErrorRate:
 
@@ -172,3 +180,73 @@ class TestWordErrorRate:
         hyp = hyp[0]
         assert isinstance(hyp, Hypothesis)
         assert hyp.length == 3
+
+    @pytest.mark.unit
+    def test_wer_metric_decode_logprobs(self):
+        wer = WER(vocabulary=self.vocabulary, batch_dim_index=0, use_cer=False, ctc_decode=True)
+
+        labels = self.__string_to_ctc_tensor('cat').long()
+        logprobs = torch.log_softmax(
+            10.0 * torch.nn.functional.one_hot(labels, num_classes=len(self.vocabulary) + 1).float(), dim=-1
+        )
+
+        # [B, T, V] log-probabilities decode to the same text as their argmax labels
+        assert wer.ctc_decoder_predictions_tensor(logprobs) == wer.ctc_decoder_predictions_tensor(labels)
+
+        hyp = wer.ctc_decoder_predictions_tensor(logprobs, return_hypotheses=True)[0]
+        assert hyp.text == 'cat'
+        assert hyp.alignments == [3, 1, 20]
+        assert abs(hyp.score - logprobs.max(dim=-1)[0].sum().item()) < 1e-5
+
+    @pytest.mark.unit
+    def test_wer_metric_decode_batch(self):
+        wer = WER(vocabulary=self.vocabulary, batch_dim_index=0, use_cer=False, ctc_decode=True)
+
+        blank_id = len(self.vocabulary)
+        cat = self.__string_to_ctc_tensor('cat').long()
+        moo = self.__string_to_ctc_tensor('moo').long()
+        # pad 'cat' with non-blank labels, which must be ignored beyond its length
+        batch = torch.cat([torch.cat([cat, torch.full([1, 1], 9, dtype=torch.long)], dim=1), moo], dim=0)
+        length = torch.tensor([cat.shape[-1], moo.shape[-1]], dtype=torch.long)
+
+        assert wer.ctc_decoder_predictions_tensor(batch, predictions_len=length) == ['cat', 'moo']
+
+        hyps = wer.ctc_decoder_predictions_tensor(batch, predictions_len=length, return_hypotheses=True)
+        assert hyps[0].alignments == [3, 1, 20]
+        assert hyps[1].alignments == [13, 15, blank_id, 15]
+        assert hyps[0].timestep == [0, 1, 2]
+        assert hyps[1].timestep == [0, 1, 3]
+        assert [hyp.length for hyp in hyps] == [3, 4]
+
+    @pytest.mark.unit
+    @pytest.mark.skipif(not HAVE_NUMBA, reason="numba is not installed")
+    def test_ctc_greedy_decode_labels_numba(self, monkeypatch):
+        wer = WER(vocabulary=self.vocabulary, batch_dim_index=0, use_cer=False, ctc_decode=True)
+        blank_id = len(self.vocabulary)
+
+        # repeats, blanks between repeats, leading / trailing blanks, all blanks and a zero length input
+        predictions = torch.tensor(
+            [
+                [3, 3, 1, 1, 20, 20, 20, 5],
+                [3, blank_id, 3, 3, blank_id, blank_id, 3, blank_id],
+                [blank_id, 4, 4, blank_id, 4, 7, 7, blank_id],
+                [blank_id, blank_id, blank_id, blank_id, blank_id, blank_id, blank_id, blank_id],
+                [1, 2, 3, 4, 5, 6, 7, 8],
+            ]
+        )
+        predictions_len = torch.tensor([8, 8, 7, 8, 0])
+
+        # Reference: the NumPy emission mask path
+        monkeypatch.setattr(wer_module, 'HAVE_NUMBA', False)
+        hypotheses = wer.ctc_decoder_predictions_tensor(
+            predictions, predictions_len=predictions_len, return_hypotheses=True
+        )
+
+        for labels, length, hyp in zip(predictions.numpy(), predictions_len.tolist(), hypotheses):
+            tokens, timesteps = numba_utils.ctc_greedy_decode_labels(labels[:length], blank_id)
+            assert timesteps.tolist() == hyp.timestep
+            assert tokens.tolist() == labels[hyp.timestep].tolist()
+            assert wer.decode_tokens_to_str(tokens.tolist()) == hyp.text
+
+        assert hypotheses[1].timestep == [0, 2, 6]
+        assert hypotheses[4].timestep == []
@@ -19,6 +19,7 @@ from omegaconf import DictConfig, ListConfig
 
 from nemo.collections.asr.metrics import rnnt_wer
 from nemo.collections.asr.models import EncDecRNNTModel
+from nemo.collections.asr.modules import rnnt_abstract
 from nemo.collections.asr.parts import rnnt_beam_decoding as beam_decode
 from nemo.collections.asr.parts import rnnt_greedy_decoding as greedy_decode
 from nemo.utils.config_utils import assert_dataclass_signature_match
@@ -32,6 +33,43 @@ except (ImportError, ModuleNotFoundError):
     WARP_RNNT_AVAILABLE = False
 
 
+class _OneHotRNNTDecoder(rnnt_abstract.AbstractRNNTDecoder):
+    """Stateless prediction network which embeds the last emitted label as a one-hot vector."""
+
+    def __init__(self, vocab_size, blank_as_pad):
+        super().__init__(vocab_size=vocab_size, blank_idx=vocab_size, blank_as_pad=blank_as_pad)
+
+    def predict(self, y=None, state=None, add_sos=False, batch_size=None):
+        if y is None:
+            g = torch.zeros(batch_size, 1, self.vocab_size + 1)
+        else:
+            g = torch.nn.functional.one_hot(y, num_classes=self.vocab_size + 1).float()
+            g[:, :, self.blank_idx] = 0.0
+        return g, [torch.zeros(1, g.shape[0], 1)]
+
+    def initialize_state(self, y):
+        raise NotImplementedError()
+
+    def score_hypothesis(self, hypothesis, cache):
+        raise NotImplementedError()
+
+
+class _RecordingRNNTJoint(rnnt_abstract.AbstractRNNTJoint):
+    """
+    Joint which penalizes re-emitting the last label, and records the argmax label of every step.
+    The last encoder feature holds the timestep of the frame, the others hold the logits of the frame.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.steps = []
+
+    def joint(self, f, g):
+        logits = f[:, :, :-1] - 10.0 * g
+        self.steps.append((f[:, 0, -1].long().tolist(), logits[:, 0, :].argmax(dim=-1).tolist()))
+        return logits.unsqueeze(2)  # [B, T=1, U=1, V + 1]
+
+
 @pytest.fixture()
 def asr_model():
     preprocessor = {'cls': 'nemo.collections.asr.modules.AudioToMelSpectrogramPreprocessor', 'params': dict({})}
@@ -255,3 +293,37 @@ class TestEncDecRNNTModel:
         assert signatures_match
         assert cls_subset is None
         assert dataclass_subset is None
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("blank_as_pad", [True, False])
+    def test_greedy_batch_preserve_alignments(self, blank_as_pad):
+        vocab_size = 5
+        blank = vocab_size
+        decoder = _OneHotRNNTDecoder(vocab_size=vocab_size, blank_as_pad=blank_as_pad)
+        joint = _RecordingRNNTJoint()
+        decoding = greedy_decode.GreedyBatchedRNNTInfer(
+            decoder, joint, blank_index=blank, max_symbols_per_step=None, preserve_alignments=True
+        )
+
+        # Most likely label of every frame; the second sample predicts blank while the others do not,
+        # and the last sample is padded beyond its length
+        targets = [[1, blank, blank, 2], [blank, 3, 3, 4], [4, 4, blank, 1]]
+        lengths = torch.tensor([4, 4, 2])
+        encoder_output = torch.zeros(3, vocab_size + 2, 4)  # [B, D, T]
+        for batch_idx, sample_targets in enumerate(targets):
+            for time_idx, target in enumerate(sample_targets):
+                encoder_output[batch_idx, target, time_idx] = 2.0
+                encoder_output[batch_idx, blank, time_idx] += 1.0
+                encoder_output[batch_idx, -1, time_idx] = time_idx
+
+        hypotheses = decoding(encoder_output=encoder_output, encoded_lengths=lengths)[0]
+
+        for batch_idx, hyp in enumerate(hypotheses):
+            alignments = [int(label) for time_alignments in hyp.alignments for label in time_alignments]
+            expected = [
+                step_labels[batch_idx]
+                for step_times, step_labels in joint.steps
+                if step_times[batch_idx] < lengths[batch_idx]
+            ]
+            assert alignments == expected
+            assert blank in alignments